@@ -41,8 +41,9 @@ print(f"python path: {sys.path}")
 print("\ndatetime module examples:")
 now = datetime.datetime.now()
 print(f"current datetime: {now}")
-print(f"formatted date: {now.strftime('%Y-%m-%d')}")
-print(f"formatted time: {now.strftime('%H:%M:%S')}")
+# isoformat() skips the strftime format-string parser entirely
+print(f"formatted date: {now.date().isoformat()}")
+print(f"formatted time: {now.time().isoformat(timespec='seconds')}")
 
 # date arithmetic
 future_date = now + datetime.timedelta(days=7)
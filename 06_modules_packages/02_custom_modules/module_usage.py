@@ -95,19 +95,18 @@ def factorial(n: int) -> int:
     '''calculate factorial of n.'''
     if n < 0:
         raise ValueError("factorial is not defined for negative numbers")
-    if n == 0:
-        return 1
-    return n * factorial(n - 1)
+    # math.factorial is implemented in c and never hits the recursion limit
+    return math.factorial(n)
 
 @log_call
 def fibonacci(n: int) -> list:
     '''generate fibonacci sequence up to n terms.'''
     if n < 0:
         raise ValueError("number of terms cannot be negative")
-    sequence = []
+    sequence = [0] * n  # preallocate, the final size is known up front
     a, b = 0, 1
-    for _ in range(n):
-        sequence.append(a)
+    for i in range(n):
+        sequence[i] = a
         a, b = b, a + b
     return sequence
 
@@ -120,9 +119,17 @@ class MathUtils:
         '''check if a number is prime.'''
         if n < 2:
             return False
-        for i in range(2, int(math.sqrt(n)) + 1):
-            if n % i == 0:
+        if n < 4:
+            return True
+        if n % 2 == 0 or n % 3 == 0:
+            return False
+        # every prime above 3 has the form 6k +/- 1, so only test those
+        i = 5
+        limit = math.isqrt(n)
+        while i <= limit:
+            if n % i == 0 or n % (i + 2) == 0:
                 return False
+            i += 6
         return True
     
     @staticmethod
@@ -56,7 +56,7 @@ virtual environments in python are isolated environments that allow you to:
 
 # example script to demonstrate virtual environment usage
 import sys
-import pkg_resources
+from importlib.metadata import distributions
 
 def get_python_info():
     """get information about the python environment."""
@@ -69,8 +69,8 @@ def get_python_info():
 def list_installed_packages():
     """list all installed packages and their versions."""
     return [
-        f"{pkg.key} {pkg.version}"
-        for pkg in pkg_resources.working_set
+        f"{dist.metadata['Name']} {dist.version}"
+        for dist in distributions()
     ]
 
 def main():
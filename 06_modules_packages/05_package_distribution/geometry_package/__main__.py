@@ -0,0 +1,5 @@
+# entry point for the `geometry` console script and `python -m geometry_package`
+from .cli import main as cli
+
+if __name__ == "__main__":
+    cli()
@@ -4,18 +4,12 @@ import json
 import sys
 from typing import List, Dict, Any
 
-from .shapes import Circle, Square, Rectangle
-from .utils import (
-    create_shape,
-    serialize_shape,
-    calculate_area,
-    calculate_perimeter,
-    generate_shape_report
-)
+# the shape and utils helpers are imported inside the handlers that use them
 
 def create_parser() -> argparse.ArgumentParser:
     """create the command-line argument parser."""
     parser = argparse.ArgumentParser(
+        prog="geometry",
         description="geometry utilities command-line interface"
     )
     
@@ -45,10 +39,16 @@ def create_parser() -> argparse.ArgumentParser:
     export_parser.add_argument("--params", required=True, help="shape parameters as JSON string")
     export_parser.add_argument("--output", help="output file for JSON")
     
+    # refresh-plugins command
+    subparsers.add_parser("refresh-plugins", help="rescan and cache installed plugins")
+    
     return parser
 
 def handle_shape_command(shape_type: str, args: argparse.Namespace) -> None:
     """handle commands for individual shapes."""
+    from .shapes import Circle, Square, Rectangle
+    from .utils import calculate_area, calculate_perimeter
+    
     try:
         if shape_type == "circle":
             shape = Circle(args.radius)
@@ -69,6 +69,8 @@ def handle_shape_command(shape_type: str, args: argparse.Namespace) -> None:
 
 def handle_report_command(args: argparse.Namespace) -> None:
     """handle the report generation command."""
+    from .utils import create_shape, generate_shape_report
+    
     try:
         with open(args.file, 'r') as f:
             data = json.load(f)
@@ -94,6 +96,8 @@ def handle_report_command(args: argparse.Namespace) -> None:
 
 def handle_export_command(args: argparse.Namespace) -> None:
     """handle the shape export command."""
+    from .utils import create_shape, serialize_shape
+    
     try:
         params = json.loads(args.params)
         shape = create_shape(args.shape, **params)
@@ -110,6 +114,13 @@ def handle_export_command(args: argparse.Namespace) -> None:
         print(f"error: {e}", file=sys.stderr)
         sys.exit(1)
 
+def handle_refresh_plugins_command(args: argparse.Namespace) -> None:
+    """handle the plugin index refresh command."""
+    from .plugin_system import PluginManager
+    
+    path = PluginManager.freeze()
+    print(f"plugin index written to {path}")
+
 def main() -> None:
     """main entry point for the CLI."""
     parser = create_parser()
@@ -125,6 +136,8 @@ def main() -> None:
         handle_report_command(args)
     elif args.command == "export":
         handle_export_command(args)
+    elif args.command == "refresh-plugins":
+        handle_refresh_plugins_command(args)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
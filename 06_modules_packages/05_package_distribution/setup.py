@@ -46,7 +46,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "geometry=geometry_package.cli:main",
+            "geometry=geometry_package.__main__:cli",
         ],
     },
     package_data={
@@ -1,20 +1,29 @@
 # advanced plugin system using entry points
-import pkg_resources
-from typing import Dict, Type, List
+import importlib
+import json
+import os
+import sys
+from functools import lru_cache
+from math import pi
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, Mapping, Optional, Tuple, Type, List
 from abc import ABC, abstractmethod
 
 # plugin base class
 class ShapePlugin(ABC):
     """base class for shape plugins."""
     
-    @abstractmethod
-    def get_name(self) -> str:
-        """get the name of the shape."""
-        pass
+    # plugins are stateless; no per-instance __dict__
+    __slots__ = ()
+    
+    # name of the shape, read from the class so discovery never has to
+    # construct a plugin
+    name: ClassVar[str]
     
     @abstractmethod
-    def calculate_area(self, **params) -> float:
-        """calculate the area of the shape."""
+    def calculate_area(self, *params: float) -> float:
+        """calculate the area from values ordered as in get_parameters()."""
         pass
     
     @abstractmethod
@@ -22,25 +31,108 @@ class ShapePlugin(ABC):
         """get the required parameters for the shape."""
         pass
 
+# pre-scanned plugin index written by `geometry refresh-plugins`
+FROZEN_PLUGINS_PATH = Path.home() / ".cache" / "geometry_utils" / "plugins.json"
+
+# entry-point discovery walks every installed distribution, so it runs
+# once per group and is shared by all PluginManager instances
+@lru_cache(maxsize=None)
+def _discover_plugins(group: str) -> Mapping[str, Type[ShapePlugin]]:
+    """discover plugin classes registered under an entry-point group."""
+    # imported here so that importing this module stays cheap for
+    # consumers that never enumerate plugins
+    try:
+        from importlib import metadata as importlib_metadata
+    except ImportError:  # python < 3.8
+        import importlib_metadata  # type: ignore
+    try:
+        entry_points = importlib_metadata.entry_points(group=group)
+    except TypeError:  # python < 3.10 has no selection interface
+        entry_points = importlib_metadata.entry_points().get(group, [])
+    plugins: Dict[str, Type[ShapePlugin]] = {}
+    for entry_point in entry_points:
+        try:
+            plugin_class = entry_point.load()
+            # a plain mro membership test skips ABCMeta.__subclasscheck__ and
+            # its registry/__subclasshook__ machinery
+            if ShapePlugin in getattr(plugin_class, "__mro__", ()):
+                plugins[plugin_class.name] = plugin_class
+                print(f"loaded plugin: {plugin_class.name}")
+        except Exception as e:
+            print(f"error loading plugin {entry_point.name}: {e}")
+    return MappingProxyType(plugins)
+
 # plugin manager
 class PluginManager:
     """manages shape plugins using entry points."""
     
     def __init__(self):
-        self.plugins: Dict[str, Type[ShapePlugin]] = {}
-        self._load_plugins()
+        self._plugins: Optional[Dict[str, Type[ShapePlugin]]] = None
+        # plugins are stateless, so one bound calculate_area and its
+        # parameter names per shape serve every call
+        self._dispatch: Dict[str, Tuple[Callable[..., float], Tuple[str, ...]]] = {}
+    
+    @property
+    def plugins(self) -> Dict[str, Type[ShapePlugin]]:
+        """discovered plugins, loaded on first access."""
+        if self._plugins is None:
+            self._load_plugins()
+        return self._plugins
     
     def _load_plugins(self):
-        """load plugins from entry points."""
-        for entry_point in pkg_resources.iter_entry_points('geometry.plugins'):
+        """load plugins from the frozen index, or from entry points."""
+        frozen = self._load_frozen(FROZEN_PLUGINS_PATH)
+        if frozen is not None:
+            self._plugins = frozen
+        else:
+            self._plugins = dict(_discover_plugins('geometry.plugins'))
+    
+    @staticmethod
+    def _load_frozen(path: Path) -> Optional[Dict[str, Type[ShapePlugin]]]:
+        """load plugins from a frozen index, or None if it is missing or stale."""
+        try:
+            frozen_mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        # installing or removing a distribution touches site-packages, which
+        # may have added or removed plugins since the index was written
+        for entry in sys.path:
+            if os.path.basename(entry) not in ("site-packages", "dist-packages"):
+                continue
             try:
-                plugin_class = entry_point.load()
-                if issubclass(plugin_class, ShapePlugin):
-                    plugin = plugin_class()
-                    self.plugins[plugin.get_name()] = plugin_class
-                    print(f"loaded plugin: {plugin.get_name()}")
-            except Exception as e:
-                print(f"error loading plugin {entry_point.name}: {e}")
+                if os.stat(entry).st_mtime > frozen_mtime:
+                    return None
+            except OSError:
+                continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                index = json.load(f)
+            plugins = {}
+            for name, target in index.items():
+                module_name, _, attr = target.partition(":")
+                plugins[name] = getattr(importlib.import_module(module_name), attr)
+        except (ValueError, ImportError, AttributeError) as e:
+            print(f"ignoring frozen plugin index {path}: {e}")
+            return None
+        return plugins
+    
+    @staticmethod
+    def freeze(path: Path = FROZEN_PLUGINS_PATH) -> Path:
+        """scan entry points and write the plugin index to path."""
+        _discover_plugins.cache_clear()
+        index = {
+            name: f"{plugin_class.__module__}:{plugin_class.__qualname__}"
+            for name, plugin_class in _discover_plugins('geometry.plugins').items()
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        return path
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """forget discovered plugins so the next manager rescans entry points."""
+        _discover_plugins.cache_clear()
     
     def get_plugin(self, name: str) -> Type[ShapePlugin]:
         """get a plugin by name."""
@@ -54,21 +146,27 @@ class PluginManager:
     
     def calculate_area(self, shape: str, **params) -> float:
         """calculate area using the specified plugin."""
-        plugin_class = self.get_plugin(shape)
-        plugin = plugin_class()
-        return plugin.calculate_area(**params)
+        dispatch = self._dispatch.get(shape)
+        if dispatch is None:
+            plugin = self.get_plugin(shape)()
+            dispatch = (plugin.calculate_area, tuple(plugin.get_parameters()))
+            self._dispatch[shape] = dispatch
+        calculate, names = dispatch
+        try:
+            args = [params[name] for name in names]
+        except KeyError as e:
+            raise ValueError(f"{e.args[0]} parameter required") from None
+        return calculate(*args)
 
 # example plugin implementation
 class CirclePlugin(ShapePlugin):
     """circle shape plugin."""
     
-    def get_name(self) -> str:
-        return "circle"
+    __slots__ = ()
+    name = "circle"
     
-    def calculate_area(self, **params) -> float:
-        if "radius" not in params:
-            raise ValueError("radius parameter required")
-        return 3.14159 * params["radius"] ** 2
+    def calculate_area(self, radius: float) -> float:
+        return pi * radius * radius
     
     def get_parameters(self) -> List[str]:
         return ["radius"]
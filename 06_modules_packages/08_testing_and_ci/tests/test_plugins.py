@@ -1,28 +1,26 @@
 # tests for geometry package plugin system
 import pytest
+from math import pi
+from geometry_package import plugin_system
 from geometry_package.plugin_system import ShapePlugin, PluginManager
 
 # mock plugins for testing
 class MockCirclePlugin(ShapePlugin):
-    def get_name(self) -> str:
-        return "circle"
+    __slots__ = ()
+    name = "circle"
     
-    def calculate_area(self, **params) -> float:
-        if "radius" not in params:
-            raise ValueError("radius required")
-        return 3.14159 * params["radius"] ** 2
+    def calculate_area(self, radius: float) -> float:
+        return pi * radius * radius
     
     def get_parameters(self) -> list:
         return ["radius"]
 
 class MockRectanglePlugin(ShapePlugin):
-    def get_name(self) -> str:
-        return "rectangle"
+    __slots__ = ()
+    name = "rectangle"
     
-    def calculate_area(self, **params) -> float:
-        if "width" not in params or "height" not in params:
-            raise ValueError("width and height required")
-        return params["width"] * params["height"]
+    def calculate_area(self, width: float, height: float) -> float:
+        return width * height
     
     def get_parameters(self) -> list:
         return ["width", "height"]
@@ -36,86 +34,103 @@ class MockEntryPoint:
     def load(self):
         return self._plugin_class
 
-@pytest.fixture
-def mock_entry_points(monkeypatch):
-    """fixture to mock pkg_resources.iter_entry_points."""
-    def mock_iter_entry_points(group):
-        if group == "geometry.plugins":
-            return [
-                MockEntryPoint("circle", MockCirclePlugin),
-                MockEntryPoint("rectangle", MockRectanglePlugin)
-            ]
-        return []
-    
-    import pkg_resources
-    monkeypatch.setattr(pkg_resources, "iter_entry_points", mock_iter_entry_points)
+class MockEntryPoints(list):
+    """mimics the importlib.metadata.EntryPoints selection interface."""
+    
+    def select(self, group=None):
+        return self if group == "geometry.plugins" else MockEntryPoints()
+
+@pytest.fixture(scope="class")
+def mock_entry_points(tmp_path_factory):
+    """fixture to mock importlib.metadata.entry_points."""
+    def mock_importlib_entry_points(group=None):
+        entry_points = MockEntryPoints([
+            MockEntryPoint("circle", MockCirclePlugin),
+            MockEntryPoint("rectangle", MockRectanglePlugin)
+        ])
+        return entry_points if group is None else entry_points.select(group=group)
+    
+    from importlib import metadata
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(metadata, "entry_points", mock_importlib_entry_points)
+        # keep a frozen index in the user's cache from shadowing the mock
+        frozen_path = tmp_path_factory.mktemp("plugins") / "plugins.json"
+        mp.setattr(plugin_system, "FROZEN_PLUGINS_PATH", frozen_path)
+        
+        # discovery is cached per process, so rescan against the mock
+        PluginManager.invalidate_cache()
+        yield
+    PluginManager.invalidate_cache()
+
+@pytest.fixture(scope="class")
+def manager(mock_entry_points):
+    """fixture providing one plugin manager shared by a test class."""
+    return PluginManager()
 
 class TestPluginSystem:
     """test cases for plugin system."""
     
-    def test_plugin_loading(self, mock_entry_points):
+    def test_plugin_loading(self, manager):
         """test plugin loading from entry points."""
-        manager = PluginManager()
         assert len(manager.plugins) == 2
         assert "circle" in manager.plugins
         assert "rectangle" in manager.plugins
     
-    def test_plugin_listing(self, mock_entry_points):
+    def test_plugin_listing(self, manager):
         """test listing available plugins."""
-        manager = PluginManager()
         plugins = manager.list_plugins()
         assert len(plugins) == 2
         assert "circle" in plugins
         assert "rectangle" in plugins
     
-    def test_get_plugin(self, mock_entry_points):
+    def test_get_plugin(self, manager):
         """test getting specific plugin."""
-        manager = PluginManager()
         circle_plugin = manager.get_plugin("circle")
         assert issubclass(circle_plugin, ShapePlugin)
-        assert circle_plugin().get_name() == "circle"
+        assert circle_plugin.name == "circle"
     
-    def test_invalid_plugin(self, mock_entry_points):
+    def test_invalid_plugin(self, manager):
         """test getting non-existent plugin."""
-        manager = PluginManager()
         with pytest.raises(ValueError):
             manager.get_plugin("triangle")
     
-    def test_circle_area_calculation(self, mock_entry_points):
+    def test_circle_area_calculation(self, manager):
         """test area calculation using circle plugin."""
-        manager = PluginManager()
         area = manager.calculate_area("circle", radius=5)
-        expected_area = 3.14159 * 25
+        expected_area = pi * 25
         assert abs(area - expected_area) < 1e-10
     
-    def test_rectangle_area_calculation(self, mock_entry_points):
+    def test_rectangle_area_calculation(self, manager):
         """test area calculation using rectangle plugin."""
-        manager = PluginManager()
         area = manager.calculate_area("rectangle", width=4, height=3)
         assert area == 12
     
-    def test_missing_parameters(self, mock_entry_points):
+    def test_missing_parameters(self, manager):
         """test error handling for missing parameters."""
-        manager = PluginManager()
         with pytest.raises(ValueError):
             manager.calculate_area("circle")  # missing radius
         with pytest.raises(ValueError):
             manager.calculate_area("rectangle", width=4)  # missing height
     
-    def test_plugin_parameters(self, mock_entry_points):
+    def test_plugin_parameters(self, manager):
         """test getting plugin parameters."""
-        manager = PluginManager()
         circle_plugin = manager.get_plugin("circle")()
         rect_plugin = manager.get_plugin("rectangle")()
         
         assert circle_plugin.get_parameters() == ["radius"]
         assert rect_plugin.get_parameters() == ["width", "height"]
+    
+    def test_frozen_plugin_index(self, mock_entry_points, tmp_path):
+        """test loading plugins from a frozen index."""
+        path = PluginManager.freeze(tmp_path / "plugins.json")
+        
+        frozen = PluginManager._load_frozen(path)
+        assert frozen == {"circle": MockCirclePlugin, "rectangle": MockRectanglePlugin}
+        assert PluginManager._load_frozen(tmp_path / "missing.json") is None
 
 # integration test example
-def test_plugin_integration(mock_entry_points):
+def test_plugin_integration(manager):
     """test complete plugin workflow."""
-    manager = PluginManager()
-    
     # list plugins
     plugins = manager.list_plugins()
     assert len(plugins) == 2
@@ -125,5 +140,5 @@ def test_plugin_integration(mock_entry_points):
     rect_area = manager.calculate_area("rectangle", width=3, height=4)
     
     # verify results
-    assert abs(circle_area - (3.14159 * 4)) < 1e-10
+    assert abs(circle_area - (pi * 4)) < 1e-10
     assert rect_area == 12 
\ No newline at end of file
@@ -16,9 +16,14 @@ async def load_module_async(module_name: str) -> Any:
     returns:
         the loaded module object
     """
-    # simulate async loading (in real scenarios, this could be network-based module loading)
-    await asyncio.sleep(1)  # simulates some async work
-    return importlib.import_module(module_name)
+    # already-imported modules need no finder/loader walk at all
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    
+    # run the import in a worker thread so file reads and unmarshalling
+    # don't block the event loop, and concurrent loads overlap their i/o
+    return await asyncio.to_thread(importlib.import_module, module_name)
 
 async def main():
     # demonstrates how to load modules asynchronously
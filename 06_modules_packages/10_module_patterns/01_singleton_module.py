@@ -1,27 +1,19 @@
 # singleton module pattern in python
-# this pattern ensures only one instance of a module is created
+# modules are only executed once per process, so an instance created at
+# module level is shared by everything that imports it
 
 class ConfigurationManager:
-    """a singleton class to manage application configuration
+    """a class to manage application configuration
     
-    this demonstrates the singleton pattern where only one instance
-    of the configuration manager exists throughout the application
+    this demonstrates the module singleton pattern: the module creates
+    the one instance below and callers import it instead of constructing
+    their own
     """
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        # ensures only one instance is created
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = ('settings',)
     
     def __init__(self):
-        # initialize only once
-        if not ConfigurationManager._initialized:
-            self.settings = {}
-            self._load_default_settings()
-            ConfigurationManager._initialized = True
+        self.settings = {}
+        self._load_default_settings()
     
     def _load_default_settings(self):
         """loads default configuration settings"""
@@ -51,18 +43,25 @@ class ConfigurationManager:
         self.settings[key] = value
         print(f"updated setting: {key} = {value}")
 
+# the shared instance; callers use `from singleton_module import config`
+config = ConfigurationManager()
+
+def get_config() -> ConfigurationManager:
+    """returns the shared configuration manager"""
+    return config
+
 # practical usage example
 def main():
-    # first instance
-    config1 = ConfigurationManager()
+    # first access
+    config1 = get_config()
     print("\nfirst instance settings:")
     print(config1.settings)
     
     # update a setting
     config1.update_setting('debug_mode', True)
     
-    # create another instance (will be the same instance)
-    config2 = ConfigurationManager()
+    # access it again (will be the same instance)
+    config2 = get_config()
     print("\nsecond instance settings (same as first):")
     print(config2.settings)
     
@@ -1,8 +1,10 @@
 # secure module importing practices in python
 import importlib
+import importlib.util
 import sys
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Tuple
 import hashlib
 
 class SecureModuleLoader:
@@ -15,15 +17,20 @@ class SecureModuleLoader:
     - handle imports securely
     """
     
+    __slots__ = ('module_hashes', '_stat_cache')
+    
+    # allowlist of trusted modules, shared by every loader
+    TRUSTED_MODULES: ClassVar[FrozenSet[str]] = frozenset({
+        'json', 'csv', 'datetime', 
+        'math', 'random', 'collections'
+    })
+    
     def __init__(self):
-        # allowlist of trusted modules
-        self.trusted_modules = {
-            'json', 'csv', 'datetime', 
-            'math', 'random', 'collections'
-        }
-        
         # store module hashes for integrity checking
         self.module_hashes = {}
+        
+        # (mtime_ns, size, hash) per path, so unchanged files aren't re-read
+        self._stat_cache: Dict[str, Tuple[int, int, str]] = {}
     
     def calculate_module_hash(self, module_path: str) -> Optional[str]:
         """calculates a hash of the module file for integrity checking
@@ -35,12 +42,47 @@ class SecureModuleLoader:
             sha256 hash of the file contents or None if file not found
         """
         try:
+            st = os.stat(module_path)
+            cached = self._stat_cache.get(module_path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
+            
             with open(module_path, 'rb') as f:
-                content = f.read()
-                return hashlib.sha256(content).hexdigest()
+                if hasattr(hashlib, 'file_digest'):  # python 3.11+
+                    digest = hashlib.file_digest(f, 'sha256').hexdigest()
+                else:
+                    digest = hashlib.sha256(f.read()).hexdigest()
         except FileNotFoundError:
             print(f"warning: module file not found: {module_path}")
             return None
+        
+        self._stat_cache[module_path] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+    
+    def prewarm(self, module_names: List[str]) -> Dict[str, Optional[str]]:
+        """hashes a set of modules up front, in parallel
+        
+        hashlib releases the GIL while hashing, so independent files are
+        read and hashed concurrently across threads.
+        
+        args:
+            module_names: names of the modules to pre-verify
+            
+        returns:
+            mapping of module name to its sha256 hash
+        """
+        origins = {}
+        for module_name in module_names:
+            spec = importlib.util.find_spec(module_name)
+            if spec is not None and spec.origin and os.path.isfile(spec.origin):
+                origins[module_name] = spec.origin
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            hashes = dict(zip(origins, executor.map(self.calculate_module_hash, origins.values())))
+        
+        for module_name, module_hash in hashes.items():
+            self.module_hashes.setdefault(module_name, module_hash)
+        return hashes
     
     def verify_module_integrity(self, module_name: str, module_path: str) -> bool:
         """verifies the integrity of a module before loading
@@ -72,7 +114,7 @@ class SecureModuleLoader:
             imported module object or None if import fails security checks
         """
         # check if module is in allowlist
-        if module_name not in self.trusted_modules:
+        if module_name not in self.TRUSTED_MODULES:
             print(f"security error: module '{module_name}' not in trusted modules list")
             return None
         
@@ -105,6 +147,9 @@ def main():
     
     print("demonstrating secure module loading:")
     
+    # hash the whole allowlist once at startup
+    loader.prewarm(sorted(loader.TRUSTED_MODULES))
+    
     # try loading a trusted module
     print("\nattempting to load trusted module 'json':")
     json_module = loader.secure_import('json')
@@ -1,82 +1,247 @@
 # advanced file system operations in python
+import asyncio
 import os
 import shutil
 import stat
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Generator, Optional
+from typing import Callable, List, Deque, DefaultDict, Dict, Any, Generator, Optional, Tuple
+from collections import defaultdict, deque
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 import hashlib
+import mmap
 import fnmatch
+import re
 import tempfile
 import platform
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    # simd-accelerated, and plenty for spotting duplicates
+    import blake3
+except ImportError:
+    blake3 = None
+
+# the algorithm used to fingerprint files in find_duplicate_files; it only
+# has to tell contents apart, not resist attackers. 'blake2b-128' is blake2b
+# cut to a 16-byte digest: no collision is expected below ~2**64 files, and
+# it outruns sha256 on cpus without sha extensions
+DEDUP_ALGORITHM = 'blake3' if blake3 is not None else 'blake2b-128'
+
+# above this size, files are hashed straight from a memory map
+MMAP_HASH_THRESHOLD = 16 << 20
+
+# read size for the chunked hashing fallback
+_CHUNK = 1 << 20
+
 class FileSystemWatcher(FileSystemEventHandler):
     """file system event handler for monitoring changes."""
     
     def __init__(self):
-        self.changes: List[Dict[str, Any]] = []
+        # appended from watchdog's thread while the main thread reads
+        self.changes: Deque[Dict[str, Any]] = deque()
     
-    def on_created(self, event):
+    def _record(self, change_type: str, event) -> None:
+        # a raw timestamp is cheap; datetimes are built in get_changes
         if not event.is_directory:
             self.changes.append({
-                'type': 'created',
+                'type': change_type,
                 'path': event.src_path,
-                'time': datetime.now()
+                'ns': time.time_ns()
             })
     
+    def on_created(self, event):
+        self._record('created', event)
+    
     def on_modified(self, event):
-        if not event.is_directory:
-            self.changes.append({
-                'type': 'modified',
-                'path': event.src_path,
-                'time': datetime.now()
-            })
+        self._record('modified', event)
     
     def on_deleted(self, event):
-        if not event.is_directory:
-            self.changes.append({
-                'type': 'deleted',
-                'path': event.src_path,
-                'time': datetime.now()
-            })
+        self._record('deleted', event)
+    
+    def get_changes(self) -> List[Dict[str, Any]]:
+        """return recorded changes with their times as datetimes."""
+        return [
+            {'type': c['type'], 'path': c['path'],
+             'time': datetime.fromtimestamp(c['ns'] / 1e9)}
+            for c in list(self.changes)
+        ]
 
-def calculate_file_hash(filename: str, algorithm: str = 'sha256') -> Optional[str]:
-    """calculate hash of file contents."""
+def hash_backend_info() -> Dict[str, Any]:
+    """report which implementation hashlib uses for sha256."""
+    # openssl-backed constructors are named openssl_<algorithm>; openssl 3
+    # uses the cpu's sha extensions (sha-ni / armv8 crypto) when present
+    import ssl
+    return {
+        'openssl': ssl.OPENSSL_VERSION,
+        'openssl_sha256': hashlib.sha256.__name__.startswith('openssl_'),
+        'openssl_3': ssl.OPENSSL_VERSION_INFO >= (3,),
+        'dedup_algorithm': DEDUP_ALGORITHM,
+    }
+
+@lru_cache(maxsize=8)
+def _hash_constructor(algorithm: str) -> Callable[[], Any]:
+    """resolve an algorithm name to a hash constructor once, not per file."""
+    if algorithm == 'blake3' and blake3 is not None:
+        return blake3.blake3
+    if algorithm == 'blake2b-128':
+        return partial(hashlib.blake2b, digest_size=16)
+    # usedforsecurity=False keeps the fast openssl path available on fips builds
+    named = getattr(hashlib, algorithm, None)
+    if named is not None:
+        return partial(named, usedforsecurity=False)
+    return partial(hashlib.new, algorithm, usedforsecurity=False)
+
+def _new_hash(algorithm: str):
+    """create a hash object for checksums, not for security purposes."""
+    return _hash_constructor(algorithm)()
+
+def _file_digest(filename: str, algorithm: str) -> Optional[bytes]:
+    """calculate the raw hash digest of file contents."""
     try:
-        hash_func = getattr(hashlib, algorithm)()
-        with open(filename, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
+        new_hash = _hash_constructor(algorithm)
+        # unbuffered: both paths below do their own large reads
+        with open(filename, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > MMAP_HASH_THRESHOLD:
+                # hash the page cache directly instead of copying every
+                # chunk into a python buffer first
+                hash_func = new_hash()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_func.update(mm)
+                return hash_func.digest()
+            if hasattr(os, 'posix_fadvise'):
+                # let the kernel read ahead aggressively
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if hasattr(hashlib, 'file_digest'):  # python 3.11+
+                # the whole read/update loop runs in c
+                return hashlib.file_digest(f, new_hash).digest()
+            hash_func = new_hash()
+            read = f.read
+            for chunk in iter(lambda: read(_CHUNK), b''):
                 hash_func.update(chunk)
-        return hash_func.hexdigest()
+        return hash_func.digest()
     except Exception as e:
         print(f"error calculating hash: {e}")
         return None
 
-def find_duplicate_files(directory: str) -> Dict[str, List[str]]:
+def calculate_file_hash(filename: str, algorithm: str = 'sha256') -> Optional[str]:
+    """calculate hash of file contents."""
+    digest = _file_digest(filename, algorithm)
+    return digest.hex() if digest is not None else None
+
+def _scan_files(directory: str) -> Generator[os.DirEntry, None, None]:
+    """yield a DirEntry for every file below directory, like os.walk.
+    
+    DirEntry caches the file type from the directory listing, and its stat
+    result after the first call, so no extra syscalls are needed.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        return
+
+def _head_hash(filename: str, size: int = 4096) -> Optional[bytes]:
+    """hash only the first bytes of a file, as a cheap duplicate prefilter."""
+    try:
+        # unbuffered, so only the requested bytes are read
+        with open(filename, 'rb', buffering=0) as f:
+            hash_func = _new_hash(DEDUP_ALGORITHM)
+            hash_func.update(f.read(size))
+            return hash_func.digest()
+    except OSError as e:
+        print(f"error calculating hash: {e}")
+        return None
+
+def find_duplicate_files(directory: str) -> Dict[bytes, List[str]]:
     """find duplicate files based on content hash."""
-    hash_dict: Dict[str, List[str]] = {}
+    # group by size first: a file with a unique size can't have a duplicate,
+    # so it never needs to be read
+    size_dict: DefaultDict[int, List[str]] = defaultdict(list)
+    # symlinks and extra hardlinks are the same file under another name,
+    # so they're skipped rather than hashed again
+    seen = set()
+    for entry in _scan_files(directory):
+        if entry.is_symlink():
+            continue
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        # DirEntry.stat() reports st_ino 0 on windows, so files can only be
+        # told apart by inode where it is actually filled in
+        if st.st_ino:
+            key = (st.st_dev, st.st_ino)
+            if key in seen:
+                continue
+            seen.add(key)
+        size_dict[st.st_size].append(entry.path)
+    candidates = [path for paths in size_dict.values() if len(paths) > 1 for path in paths]
     
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            filepath = os.path.join(root, filename)
-            file_hash = calculate_file_hash(filepath)
+    # hashing releases the gil, so files are hashed concurrently
+    # keyed by raw digest bytes: half the size of hex keys and cheaper to hash
+    hash_dict: DefaultDict[bytes, List[str]] = defaultdict(list)
+    workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # then by the hash of the first 4 KiB; files that already differ
+        # there are never read in full
+        sizes = [size for size, paths in size_dict.items() if len(paths) > 1 for _ in paths]
+        head_dict: DefaultDict[Tuple[int, bytes], List[str]] = defaultdict(list)
+        heads = executor.map(_head_hash, candidates)
+        for size, filepath, head in zip(sizes, candidates, heads):
+            if head is not None:
+                head_dict[(size, head)].append(filepath)
+        candidates = [path for paths in head_dict.values() if len(paths) > 1 for path in paths]
+        
+        hashes = executor.map(_file_digest, candidates,
+                              [DEDUP_ALGORITHM] * len(candidates))
+        for filepath, file_hash in zip(candidates, hashes):
             if file_hash:
-                hash_dict.setdefault(file_hash, []).append(filepath)
+                hash_dict[file_hash].append(filepath)
     
-    # return only duplicates
-    return {k: v for k, v in hash_dict.items() if len(v) > 1}
+    # return only duplicates, as a plain dict so lookups of other digests
+    # raise KeyError instead of inserting an empty list
+    return {file_hash: paths for file_hash, paths in hash_dict.items() if len(paths) > 1}
+
+async def hash_files_async(paths: List[str], algorithm: str = DEDUP_ALGORITHM,
+                           max_in_flight: int = 64) -> List[Tuple[str, Optional[str]]]:
+    """hash many files concurrently from async code.
+    
+    keeping many reads in flight lets the kernel overlap them, which matters
+    most for trees of small files; the semaphore bounds open descriptors.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    
+    async def hash_one(path: str) -> Tuple[str, Optional[str]]:
+        async with semaphore:
+            return path, await asyncio.to_thread(calculate_file_hash, path, algorithm)
+    
+    return await asyncio.gather(*(hash_one(path) for path in paths))
 
 def find_files(directory: str, pattern: str) -> Generator[str, None, None]:
     """find files matching pattern recursively."""
-    for root, _, files in os.walk(directory):
-        for filename in fnmatch.filter(files, pattern):
-            yield os.path.join(root, filename)
+    # compile the glob once; matching is case-insensitive where the
+    # filesystem is, as with fnmatch.fnmatch
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    match = re.compile(fnmatch.translate(pattern), flags).match
+    for entry in _scan_files(directory):
+        if match(entry.name):
+            yield entry.path
 
-def get_file_info(filename: str) -> Dict[str, Any]:
-    """get detailed file information."""
+def get_file_info(filename: str, include_hash: bool = False) -> Dict[str, Any]:
+    """get detailed file information.
+    
+    hashing reads the whole file, so it only happens when include_hash is set.
+    """
     try:
         stat_info = os.stat(filename)
         return {
@@ -90,7 +255,8 @@ def get_file_info(filename: str) -> Dict[str, Any]:
             'is_file': os.path.isfile(filename),
             'is_dir': os.path.isdir(filename),
             'is_link': os.path.islink(filename),
-            'hash': calculate_file_hash(filename) if os.path.isfile(filename) else None
+            'hash': (calculate_file_hash(filename)
+                     if include_hash and os.path.isfile(filename) else None)
         }
     except Exception as e:
         print(f"error getting file info: {e}")
@@ -136,7 +302,7 @@ def monitor_directory(directory: str, duration: int = 60) -> List[Dict[str, Any]
         observer.stop()
         observer.join()
     
-    return event_handler.changes
+    return event_handler.get_changes()
 
 def create_secure_tempfile(content: str = "") -> str:
     """create a secure temporary file."""
@@ -179,14 +345,25 @@ def main():
     shutil.copy(os.path.join(test_dir, "file0.txt"),
                 os.path.join(test_dir, "file0_duplicate.txt"))
     
+    # hashing backend
+    print("hash backend:")
+    for key, value in hash_backend_info().items():
+        print(f"  {key}: {value}")
+    
     # find duplicate files
-    print("finding duplicate files:")
+    print("\nfinding duplicate files:")
     duplicates = find_duplicate_files(test_dir)
     for hash_value, file_list in duplicates.items():
-        print(f"\nhash: {hash_value}")
+        print(f"\nhash: {hash_value.hex()}")
         for file in file_list:
             print(f"  {file}")
     
+    # hash files concurrently from an event loop
+    print("\nhashing files with asyncio:")
+    paths = sorted(find_files(test_dir, "*.txt"))
+    for path, file_hash in asyncio.run(hash_files_async(paths)):
+        print(f"  {path}: {file_hash}")
+    
     # find files by pattern
     print("\nfinding files by pattern:")
     for file in find_files(test_dir, "*.txt"):
@@ -195,7 +372,7 @@ def main():
     # get file information
     print("\nfile information:")
     file_path = os.path.join(test_dir, "file0.txt")
-    info = get_file_info(file_path)
+    info = get_file_info(file_path, include_hash=True)
     for key, value in info.items():
         print(f"{key}: {value}")
     
@@ -1,5 +1,8 @@
 # reading and writing text files in python
+from collections import Counter
+from itertools import islice
 from typing import List, Optional, Iterator
+import mmap
 import os
 
 def read_entire_file(filename: str) -> Optional[str]:
@@ -21,9 +24,13 @@ def read_lines(filename: str) -> Optional[List[str]]:
         return None
 
 def read_lines_iterator(filename: str) -> Iterator[str]:
-    """read file line by line using an iterator."""
+    """read file line by line using an iterator.
+    
+    lines are read lazily through a 1 MiB buffer, so memory use doesn't
+    grow with the file and the first line is available immediately.
+    """
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8', buffering=1 << 20) as f:
             for line in f:
                 yield line.strip()
     except IOError as e:
@@ -42,8 +49,11 @@ def write_text(filename: str, content: str) -> bool:
 def write_lines(filename: str, lines: List[str]) -> bool:
     """write list of lines to file."""
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.writelines(line + '\n' for line in lines)
+        # one join and one large write instead of a temporary string per line
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            if lines:
+                f.write('\n'.join(lines))
+                f.write('\n')
         return True
     except IOError as e:
         print(f"error writing file: {e}")
@@ -63,12 +73,10 @@ def read_with_context(filename: str, start_line: int, num_lines: int) -> List[st
     """read specific lines with context."""
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            # skip to start line
-            for _ in range(start_line - 1):
-                next(f, None)
-            
-            # read requested lines
-            return [next(f, '').strip() for _ in range(num_lines)]
+            # islice skips to the start line and stops after num_lines in c
+            # a negative count reads nothing, as range() did; islice would raise
+            start = max(start_line - 1, 0)
+            return [line.strip() for line in islice(f, start, start + max(num_lines, 0))]
     except IOError as e:
         print(f"error reading file: {e}")
         return []
@@ -76,11 +84,27 @@ def read_with_context(filename: str, start_line: int, num_lines: int) -> List[st
 def search_text(filename: str, search_term: str) -> List[tuple[int, str]]:
     """search for text in file and return matching lines with line numbers."""
     matches = []
+    term = search_term.encode('utf-8')
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f, 1):
-                if search_term in line:
-                    matches.append((i, line.strip()))
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:  # empty files can't be mapped
+                return matches
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # mm.find scans in c, so lines without a match are never
+                # touched from python
+                line_number, counted = 1, 0
+                pos = mm.find(term)
+                while 0 <= pos < size:
+                    line_number += mm[counted:pos].count(b'\n')
+                    counted = pos
+                    start = mm.rfind(b'\n', 0, pos) + 1
+                    end = mm.find(b'\n', pos)
+                    if end == -1:
+                        end = size
+                    matches.append((line_number, mm[start:end].decode('utf-8').strip()))
+                    # continue after this line so each line is reported once
+                    pos = mm.find(term, end + 1)
         return matches
     except IOError as e:
         print(f"error searching file: {e}")
@@ -88,14 +112,10 @@ def search_text(filename: str, search_term: str) -> List[tuple[int, str]]:
 
 def count_words(filename: str) -> dict[str, int]:
     """count word frequency in file."""
-    word_count = {}
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                words = line.strip().lower().split()
-                for word in words:
-                    word_count[word] = word_count.get(word, 0) + 1
-        return word_count
+            # one split over the whole text; Counter tallies it in c
+            return dict(Counter(f.read().lower().split()))
     except IOError as e:
         print(f"error counting words: {e}")
         return {}
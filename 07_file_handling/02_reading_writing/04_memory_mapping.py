@@ -7,6 +7,11 @@ from pathlib import Path
 import tempfile
 import struct
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def demonstrate_basic_mmap():
     """shows basic memory-mapped file operations
     
@@ -75,30 +80,41 @@ def work_with_structured_data():
         # open file for memory mapping
         with open(temp_file.name, "r+b") as file:
             # calculate record size
-            record_size = struct.calcsize('5s i d')
+            record_format = '5s i d'
+            record_size = struct.calcsize(record_format)
             
             # create memory map
             with mmap.mmap(file.fileno(), 0) as mm:
-                # read and display all records
-                print("\noriginal records:")
-                for i in range(len(records)):
-                    mm.seek(i * record_size)
-                    record_bytes = mm.read(record_size)
-                    name, age, score = struct.unpack('5s i d', record_bytes)
-                    print(f"record {i + 1}: {name.decode().strip()}, {age}, {score}")
-                
-                # modify a record
-                print("\nmodifying bob's score:")
-                # locate bob's record
-                mm.seek(record_size)  # second record
-                # pack and write new data
-                new_record = struct.pack('5s i d', b"bob  ", 30, 95.0)
-                mm.write(new_record)
+                if np is not None:
+                    # a structured dtype with the same native layout as the
+                    # struct format views every record at once, without copying
+                    record_dtype = np.dtype(
+                        [('name', 'S5'), ('age', 'i4'), ('score', 'f8')], align=True
+                    )
+                    recs = np.frombuffer(mm, dtype=record_dtype)
+                    
+                    print("\noriginal records:")
+                    for i, (name, age, score) in enumerate(recs.tolist(), 1):
+                        print(f"record {i}: {name.decode().strip()}, {age}, {score}")
+                    
+                    # modify a record; this writes straight into the mapped file
+                    print("\nmodifying bob's score:")
+                    recs['score'][1] = 95.0
+                    name, age, score = recs[1].tolist()
+                    
+                    # the map can't close while the array still views it
+                    del recs
+                else:
+                    # iter_unpack walks the whole buffer in one c call
+                    print("\noriginal records:")
+                    for i, (name, age, score) in enumerate(struct.iter_unpack(record_format, mm), 1):
+                        print(f"record {i}: {name.decode().strip()}, {age}, {score}")
+                    
+                    # modify a record in place, at bob's offset
+                    print("\nmodifying bob's score:")
+                    struct.pack_into(record_format, mm, record_size, b"bob  ", 30, 95.0)
+                    name, age, score = struct.unpack_from(record_format, mm, record_size)
                 
-                # read modified record
-                mm.seek(record_size)
-                modified_bytes = mm.read(record_size)
-                name, age, score = struct.unpack('5s i d', modified_bytes)
                 print(f"modified record: {name.decode().strip()}, {age}, {score}")
 
 def demonstrate_large_file_processing():
@@ -131,7 +147,8 @@ def demonstrate_large_file_processing():
                 pattern = b"line of text"
                 print(f"\nsearching for: {pattern.decode()}")
                 
-                # find all occurrences
+                # find all occurrences directly in the map; slicing it
+                # would copy the whole file into memory first
                 position = 0
                 count = 0
                 
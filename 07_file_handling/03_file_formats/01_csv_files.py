@@ -1,13 +1,35 @@
 # working with CSV files in python
 import csv
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional, TextIO
 from pathlib import Path
-import pandas as pd
 
-def write_csv(filename: str, data: List[List[Any]], headers: Optional[List[str]] = None) -> bool:
-    """write data to CSV file."""
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# 1 MiB write buffer, so bulk writes reach the os in a few large chunks
+_BUFFER_SIZE = 1 << 20
+
+# below this many rows DictWriter is quicker than building a DataFrame
+_POLARS_MIN_ROWS = 1000
+
+def write_csv(filename: str, data: List[List[Any]], headers: Optional[List[str]] = None,
+              fast: bool = False) -> bool:
+    """write data to CSV file.
+    
+    fast joins fields directly instead of going through csv.writer; only
+    use it when no field contains a comma, quote or newline, or is None.
+    """
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
+            if fast:
+                # same \r\n terminator csv.writer uses, so output is identical
+                if headers:
+                    f.write(','.join(headers) + '\r\n')
+                f.writelines(','.join(map(str, row)) + '\r\n' for row in data)
+                return True
             writer = csv.writer(f)
             if headers:
                 writer.writerow(headers)
@@ -17,25 +39,55 @@ def write_csv(filename: str, data: List[List[Any]], headers: Optional[List[str]]
         print(f"error writing CSV: {e}")
         return False
 
-def read_csv(filename: str) -> List[List[str]]:
-    """read data from CSV file."""
-    data = []
+def iter_csv(filename: str, chunksize: Optional[int] = None,
+             as_dict: bool = False) -> Iterator[Any]:
+    """stream rows from a CSV file without loading it all into memory.
+    
+    rows are yielded one at a time, or as lists of up to chunksize rows;
+    as_dict yields dictionaries keyed by the header row instead.
+    """
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            data = list(reader)
-        return data
+        with open(filename, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f) if as_dict else csv.reader(f)
+            if chunksize is None:
+                yield from reader
+                return
+            while True:
+                chunk = list(islice(reader, chunksize))
+                if not chunk:
+                    break
+                yield chunk
     except IOError as e:
         print(f"error reading CSV: {e}")
-        return []
 
-def write_csv_dict(filename: str, data: List[Dict[str, Any]], fieldnames: Optional[List[str]] = None) -> bool:
-    """write dictionary data to CSV file."""
+def read_csv(filename: str) -> List[List[str]]:
+    """read data from CSV file."""
+    return list(iter_csv(filename))
+
+def write_csv_dict(filename: str, data: List[Dict[str, Any]], fieldnames: Optional[List[str]] = None,
+                   fast: bool = False) -> bool:
+    """write dictionary data to CSV file.
+    
+    fast writes large inputs with polars' rust CSV writer when it is
+    installed. its output differs from DictWriter's: booleans are written
+    as true/false, numbers follow the inferred column type (a float column
+    writes 2 as 2.0) and keys not in fieldnames are ignored. data polars
+    can't write falls back to DictWriter.
+    """
     try:
         if not fieldnames and data:
             fieldnames = list(data[0].keys())
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        if fast and pl is not None and len(data) > _POLARS_MIN_ROWS:
+            try:
+                df = pl.from_dicts(data, infer_schema_length=None).select(fieldnames)
+                df.write_csv(filename, line_terminator='\r\n')
+                return True
+            except (pl.exceptions.PolarsError, ValueError):
+                # e.g. nested values or a fieldname missing from every row
+                pass
+        
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(data)
@@ -46,15 +98,7 @@ def write_csv_dict(filename: str, data: List[Dict[str, Any]], fieldnames: Option
 
 def read_csv_dict(filename: str) -> List[Dict[str, str]]:
     """read CSV file into list of dictionaries."""
-    data = []
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            data = list(reader)
-        return data
-    except IOError as e:
-        print(f"error reading CSV: {e}")
-        return []
+    return list(iter_csv(filename, as_dict=True))
 
 def append_to_csv(filename: str, row: List[Any]) -> bool:
     """append a row to existing CSV file."""
@@ -67,25 +111,134 @@ def append_to_csv(filename: str, row: List[Any]) -> bool:
         print(f"error appending to CSV: {e}")
         return False
 
-def filter_csv(filename: str, column: str, value: Any) -> List[Dict[str, str]]:
-    """filter CSV data based on column value."""
+class CsvAppender:
+    """append many rows to a CSV file through one buffered handle.
+    
+    append_to_csv opens and closes the file for every row; this keeps it
+    open and lets rows accumulate in a 1 MiB buffer between writes.
+    """
+    
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.file: Optional[TextIO] = None
+        self.writer = None
+    
+    def __enter__(self) -> 'CsvAppender':
+        self.file = open(self.filename, 'a', newline='', encoding='utf-8',
+                         buffering=_BUFFER_SIZE)
+        self.writer = csv.writer(self.file)
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.file:
+            self.file.close()
+    
+    def append(self, row: List[Any]) -> bool:
+        """append a single row."""
+        if self.writer:
+            self.writer.writerow(row)
+            return True
+        return False
+    
+    def extend(self, rows: List[List[Any]]) -> bool:
+        """append several rows at once."""
+        if self.writer:
+            self.writer.writerows(rows)
+            return True
+        return False
+
+def filter_csv(filename: str, column: str, value: Any,
+               columns: Optional[List[str]] = None) -> List[Dict[str, str]]:
+    """filter CSV data based on column value.
+    
+    columns limits each returned row to those fields; with polars the
+    other columns are then never parsed at all. fields missing from short
+    rows (and unknown names in columns) come back as '' with either
+    backend; blank lines and rows whose fields are all empty are skipped.
+    """
     try:
-        data = read_csv_dict(filename)
-        return [row for row in data if row.get(column) == str(value)]
+        target = str(value)
+        if pl is not None:
+            try:
+                # lazy scan: polars memory-maps the file and runs the
+                # predicate inside its rust parser, so no per-row dicts are
+                # built for rows that don't match. every column is read as
+                # a string, and polars reads both empty and missing fields
+                # as null, so they are filled with ''
+                lf = pl.scan_csv(filename, infer_schema=False)
+                names = lf.collect_schema().names()
+                if column not in names:
+                    return []
+                # blank lines come back as all-null rows; drop them
+                lf = lf.filter(~pl.all_horizontal(pl.all().is_null()))
+                lf = lf.filter(pl.col(column).fill_null('') == target)
+                if columns is not None:
+                    lf = lf.select(columns)
+                return lf.collect().fill_null('').to_dicts()
+            except pl.exceptions.PolarsError:
+                # e.g. rows longer than the header, or an unknown column
+                # in columns; the csv module handles both
+                pass
+        
+        # stream positional rows and compare by index, so a dict is only
+        # built for rows that match
+        rows = iter_csv(filename)
+        headers = next(rows, None)
+        if headers is None or column not in headers:
+            return []
+        idx = headers.index(column)
+        width = len(headers)
+        # short rows are padded with '' and extra fields dropped, matching
+        # the polars path
+        matches = (dict(zip(headers, row + [''] * (width - len(row))))
+                   for row in rows
+                   if any(row) and (row[idx] if idx < len(row) else '') == target)
+        if columns is not None:
+            return [{name: row.get(name, '') for name in columns} for row in matches]
+        return list(matches)
     except Exception as e:
         print(f"error filtering CSV: {e}")
         return []
 
-# using pandas for advanced CSV operations
+# using polars for advanced CSV operations
+def csv_to_parquet(csv_path: str, parquet_path: str) -> bool:
+    """convert a CSV file to snappy-compressed parquet.
+    
+    parquet is columnar and typed, so repeated analytics can read just the
+    columns they need instead of re-parsing the whole CSV; the conversion
+    streams, so memory stays bounded for very large files.
+    """
+    if pl is None:
+        print("error converting to parquet: polars is not installed")
+        return False
+    try:
+        pl.scan_csv(csv_path).sink_parquet(parquet_path, compression='snappy')
+        return True
+    except Exception as e:
+        print(f"error converting to parquet: {e}")
+        return False
+
 def pandas_csv_operations(filename: str):
-    """demonstrate CSV operations using pandas."""
+    """demonstrate dataframe CSV operations using polars.
+    
+    polars parses and aggregates in rust, several times faster than pandas;
+    call .to_pandas() on the result if pandas is needed downstream. parquet
+    files (see csv_to_parquet) are accepted too.
+    """
+    if pl is None:
+        print("error in dataframe operations: polars is not installed")
+        return None
     try:
-        # read CSV into DataFrame
-        df = pd.read_csv(filename)
+        # read CSV (or parquet) into DataFrame
+        if Path(filename).suffix == '.parquet':
+            df = pl.read_parquet(filename)
+        else:
+            df = pl.read_csv(filename)
         
         # basic information
         print("\nDataFrame Info:")
-        print(df.info())
+        print(f"{df.height} rows x {df.width} columns")
+        print(df.schema)
         
         # summary statistics
         print("\nSummary Statistics:")
@@ -99,11 +252,11 @@ def pandas_csv_operations(filename: str):
         # group by operations
         if 'category' in df.columns and 'value' in df.columns:
             print("\nMean Values by Category:")
-            print(df.groupby('category')['value'].mean())
+            print(df.group_by('category').agg(pl.col('value').mean()))
         
         return df
     except Exception as e:
-        print(f"error in pandas operations: {e}")
+        print(f"error in dataframe operations: {e}")
         return None
 
 # example usage
@@ -152,13 +305,20 @@ def main():
     for person in london_people:
         print(person)
     
-    # pandas operations
-    print("\npandas operations:")
+    # dataframe operations
+    print("\ndataframe operations:")
     df = pandas_csv_operations(dict_filename)
     if df is not None:
         print("\nDataFrame head:")
         print(df.head())
     
+    # parquet conversion
+    parquet_filename = "people.parquet"
+    print("\nconverting to parquet...")
+    if csv_to_parquet(dict_filename, parquet_filename):
+        print(pl.read_parquet(parquet_filename, columns=['name', 'city']))
+        Path(parquet_filename).unlink()
+    
     # cleanup
     Path(filename).unlink()
     Path(dict_filename).unlink()
@@ -4,18 +4,47 @@ from typing import Any, Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
 
-class DateTimeEncoder(json.JSONEncoder):
-    """custom JSON encoder for datetime objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson handles datetime (and numpy arrays) natively, so it needs no
+# custom encoder; non-str keys are coerced like the stdlib does
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+def _json_default(obj: Any) -> Any:
+    """serialize datetime objects for the stdlib encoder."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _orjson_dumps(data: Any, indent: Optional[int]) -> Optional[bytes]:
+    """serialize with orjson when it can match the requested layout.
+    
+    orjson can only write compact or 2-space output, and refuses some
+    values the stdlib accepts (ints wider than 64 bits, for one); None
+    means the caller should use the stdlib encoder instead.
+    """
+    if orjson is None or indent not in (None, 2):
+        return None
+    option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(data, option=option)
+    except orjson.JSONEncodeError:
+        return None
 
 def write_json(filename: str, data: Any, indent: int = 4) -> bool:
     """write data to JSON file."""
     try:
+        # encode before opening, so a fallback never leaves a partial file
+        encoded = _orjson_dumps(data, indent)
+        if encoded is not None:
+            with open(filename, 'wb') as f:
+                f.write(encoded)
+            return True
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, cls=DateTimeEncoder)
+            json.dump(data, f, indent=indent, default=_json_default)
         return True
     except IOError as e:
         print(f"error writing JSON: {e}")
@@ -24,6 +53,15 @@ def write_json(filename: str, data: Any, indent: int = 4) -> bool:
 def read_json(filename: str) -> Optional[Any]:
     """read data from JSON file."""
     try:
+        if orjson:
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson is strict json; the stdlib also reads NaN and
+                # Infinity, which its own encoder writes
+                return json.loads(raw)
         with open(filename, 'r', encoding='utf-8') as f:
             return json.load(f)
     except IOError as e:
@@ -74,26 +112,27 @@ def validate_json_schema(data: Any, schema: Dict[str, Any]) -> bool:
 def format_json(data: Any) -> str:
     """format JSON data with proper indentation."""
     try:
-        return json.dumps(data, indent=4, cls=DateTimeEncoder)
+        # 4-space indent, which orjson can't produce
+        return json.dumps(data, indent=4, default=_json_default)
     except Exception as e:
         print(f"error formatting JSON: {e}")
         return str(data)
 
 def search_json(data: Any, key: str) -> List[Any]:
-    """recursively search for a key in JSON data."""
+    """search for a key in JSON data at any depth."""
     results = []
-    
-    def _search(obj: Any, search_key: str):
+    # explicit stack instead of recursion: no per-node call overhead and no
+    # recursion limit. each entry records whether its value matched, and
+    # children are pushed reversed so results come out in document order
+    stack = [(False, data)]
+    while stack:
+        matched, obj = stack.pop()
+        if matched:
+            results.append(obj)
         if isinstance(obj, dict):
-            for k, v in obj.items():
-                if k == search_key:
-                    results.append(v)
-                _search(v, search_key)
+            stack.extend((k == key, v) for k, v in reversed(obj.items()))
         elif isinstance(obj, list):
-            for item in obj:
-                _search(item, search_key)
-    
-    _search(data, key)
+            stack.extend((False, item) for item in reversed(obj))
     return results
 
 # example usage
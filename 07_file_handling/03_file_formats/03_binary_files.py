@@ -1,19 +1,38 @@
 # working with binary files in python
+import array
 import struct
-from typing import List, Optional, BinaryIO
+import sys
+from typing import Any, Callable, Iterable, List, Optional, BinaryIO
 import pickle
+import pickletools
 from pathlib import Path
 import io
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# precompiled little-endian field formats, so the format string isn't
+# parsed again on every pack/unpack
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+_F32 = struct.Struct('<f')
+
+# BinaryFileHandler hands pending writes to the file once they reach this size
+_WRITE_BUFFER_SIZE = 1 << 20
+
 def write_binary_numbers(filename: str, numbers: List[int]) -> bool:
     """write list of integers to binary file."""
     try:
         with open(filename, 'wb') as f:
-            # write length of list first
-            f.write(struct.pack('I', len(numbers)))
-            # write each number as 4-byte integer
-            for num in numbers:
-                f.write(struct.pack('i', num))
+            # length prefix followed by each number as a little-endian
+            # 4-byte integer, written in one go
+            if np is not None:
+                f.write(_U32.pack(len(numbers)))
+                np.asarray(numbers, dtype='<i4').tofile(f)
+            else:
+                f.write(struct.pack(f'<I{len(numbers)}i', len(numbers), *numbers))
         return True
     except IOError as e:
         print(f"error writing binary file: {e}")
@@ -22,15 +41,17 @@ def write_binary_numbers(filename: str, numbers: List[int]) -> bool:
 def read_binary_numbers(filename: str) -> Optional[List[int]]:
     """read list of integers from binary file."""
     try:
-        numbers = []
         with open(filename, 'rb') as f:
             # read length of list
-            length = struct.unpack('I', f.read(4))[0]
-            # read each number
-            for _ in range(length):
-                num = struct.unpack('i', f.read(4))[0]
-                numbers.append(num)
-        return numbers
+            length = _U32.unpack(f.read(4))[0]
+            # read and unpack all numbers at once
+            if np is not None:
+                return np.fromfile(f, dtype='<i4', count=length).tolist()
+            numbers = array.array('i')
+            numbers.fromfile(f, length)
+            if sys.byteorder != 'little':
+                numbers.byteswap()
+            return numbers.tolist()
     except IOError as e:
         print(f"error reading binary file: {e}")
         return None
@@ -39,17 +60,12 @@ def write_binary_struct(filename: str, data: dict) -> bool:
     """write structured data to binary file."""
     try:
         with open(filename, 'wb') as f:
-            # write string with length prefix
+            # length-prefixed name, two integers and a float, packed as
+            # one record and written with a single call
             name = data.get('name', '').encode('utf-8')
-            f.write(struct.pack('I', len(name)))
-            f.write(name)
-            
-            # write integers
-            f.write(struct.pack('i', data.get('age', 0)))
-            f.write(struct.pack('i', data.get('score', 0)))
-            
-            # write float
-            f.write(struct.pack('f', data.get('weight', 0.0)))
+            f.write(struct.pack(f'<I{len(name)}siif', len(name), name,
+                                data.get('age', 0), data.get('score', 0),
+                                data.get('weight', 0.0)))
         return True
     except IOError as e:
         print(f"error writing binary struct: {e}")
@@ -59,16 +75,12 @@ def read_binary_struct(filename: str) -> Optional[dict]:
     """read structured data from binary file."""
     try:
         with open(filename, 'rb') as f:
-            # read string with length prefix
-            name_length = struct.unpack('I', f.read(4))[0]
-            name = f.read(name_length).decode('utf-8')
-            
-            # read integers
-            age = struct.unpack('i', f.read(4))[0]
-            score = struct.unpack('i', f.read(4))[0]
-            
-            # read float
-            weight = struct.unpack('f', f.read(4))[0]
+            # the length prefix sizes the rest of the record, which is
+            # then read and unpacked in one go
+            name_length = _U32.unpack(f.read(4))[0]
+            name, age, score, weight = struct.unpack(
+                f'<{name_length}siif', f.read(name_length + 12))
+            name = name.decode('utf-8')
             
             return {
                 'name': name,
@@ -80,21 +92,32 @@ def read_binary_struct(filename: str) -> Optional[dict]:
         print(f"error reading binary struct: {e}")
         return None
 
-def write_pickle(filename: str, data: Any) -> bool:
-    """write data to pickle file."""
+def write_pickle(filename: str, data: Any, optimize: bool = False,
+                 buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None) -> bool:
+    """write data to pickle file.
+    
+    optimize strips unused PUT opcodes, worthwhile for small blobs that are
+    loaded often; buffer_callback receives large buffers (e.g. numpy arrays)
+    out-of-band instead of copying them into the pickle stream.
+    """
     try:
         with open(filename, 'wb') as f:
-            pickle.dump(data, f)
+            if optimize:
+                f.write(pickletools.optimize(pickle.dumps(
+                    data, protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=buffer_callback)))
+            else:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL,
+                            buffer_callback=buffer_callback)
         return True
     except IOError as e:
         print(f"error writing pickle file: {e}")
         return False
 
-def read_pickle(filename: str) -> Optional[Any]:
-    """read data from pickle file."""
+def read_pickle(filename: str, buffers: Optional[Iterable[Any]] = None) -> Optional[Any]:
+    """read data from pickle file, with any out-of-band buffers it was written with."""
     try:
         with open(filename, 'rb') as f:
-            return pickle.load(f)
+            return pickle.load(f, buffers=buffers)
     except IOError as e:
         print(f"error reading pickle file: {e}")
         return None
@@ -105,26 +128,42 @@ class BinaryFileHandler:
     def __init__(self, filename: str):
         self.filename = filename
         self.file: Optional[BinaryIO] = None
+        # writes accumulate here and reach the file in large batches
+        self._buf = bytearray()
     
     def __enter__(self) -> 'BinaryFileHandler':
         self.file = open(self.filename, 'wb+')
+        self._buf.clear()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.file:
+            self._flush()
             self.file.close()
     
+    def _flush(self):
+        """write out any buffered data."""
+        if self._buf:
+            self.file.write(self._buf)
+            self._buf.clear()
+    
+    def _append(self, data: bytes):
+        """buffer data, flushing once the buffer is large enough."""
+        self._buf += data
+        if len(self._buf) >= _WRITE_BUFFER_SIZE:
+            self._flush()
+    
     def write_int(self, value: int) -> bool:
         """write single integer."""
         if self.file:
-            self.file.write(struct.pack('i', value))
+            self._append(_I32.pack(value))
             return True
         return False
     
     def write_float(self, value: float) -> bool:
         """write single float."""
         if self.file:
-            self.file.write(struct.pack('f', value))
+            self._append(_F32.pack(value))
             return True
         return False
     
@@ -132,21 +171,22 @@ class BinaryFileHandler:
         """write string with length prefix."""
         if self.file:
             encoded = value.encode('utf-8')
-            self.file.write(struct.pack('I', len(encoded)))
-            self.file.write(encoded)
+            self._append(_U32.pack(len(encoded)) + encoded)
             return True
         return False
     
     def seek_to_start(self):
         """seek to start of file."""
         if self.file:
+            self._flush()
             self.file.seek(0)
     
     def read_int(self) -> Optional[int]:
         """read single integer."""
         if self.file:
+            self._flush()
             try:
-                return struct.unpack('i', self.file.read(4))[0]
+                return _I32.unpack(self.file.read(4))[0]
             except struct.error:
                 return None
         return None
@@ -154,8 +194,9 @@ class BinaryFileHandler:
     def read_float(self) -> Optional[float]:
         """read single float."""
         if self.file:
+            self._flush()
             try:
-                return struct.unpack('f', self.file.read(4))[0]
+                return _F32.unpack(self.file.read(4))[0]
             except struct.error:
                 return None
         return None
@@ -163,8 +204,9 @@ class BinaryFileHandler:
     def read_string(self) -> Optional[str]:
         """read string with length prefix."""
         if self.file:
+            self._flush()
             try:
-                length = struct.unpack('I', self.file.read(4))[0]
+                length = _U32.unpack(self.file.read(4))[0]
                 return self.file.read(length).decode('utf-8')
             except (struct.error, UnicodeDecodeError):
                 return None
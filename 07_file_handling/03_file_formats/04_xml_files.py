@@ -1,64 +1,87 @@
 # working with XML files in python
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+try:
+    from lxml import etree as LE
+except ImportError:
+    LE = None
+
+# elements are built with lxml when available so they can be pretty
+# printed in a single c pass; the API is the same as ElementTree's
+_etree = LE if LE is not None else ET
+
+@lru_cache(maxsize=128)
+def _xpath(expr: str) -> Any:
+    """compile an lxml XPath expression once and reuse it."""
+    return LE.XPath(expr)
+
+def _write_pretty_xml(filename: str, root: Any) -> None:
+    """serialize an element tree to file with indentation."""
+    if LE is not None:
+        xml_bytes = LE.tostring(root, pretty_print=True, xml_declaration=True, encoding='utf-8')
+    else:
+        ET.indent(root, space="  ")
+        xml_bytes = ET.tostring(root, encoding='utf-8', xml_declaration=True)
+    with open(filename, 'wb') as f:
+        f.write(xml_bytes)
+
 def write_xml(filename: str, root_tag: str, data: Dict[str, Any]) -> bool:
     """write dictionary data to XML file."""
     try:
-        root = ET.Element(root_tag)
+        root = _etree.Element(root_tag)
         
-        def _dict_to_xml(parent: ET.Element, data: Any):
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    child = ET.SubElement(parent, key)
-                    _dict_to_xml(child, value)
-            elif isinstance(data, list):
-                for item in data:
-                    child = ET.SubElement(parent, "item")
-                    _dict_to_xml(child, item)
+        # work-list instead of recursion; each element creates all of its
+        # children at once, so sibling order is preserved
+        pending = [(root, data)]
+        while pending:
+            parent, value = pending.pop()
+            if isinstance(value, dict):
+                for key, child_value in value.items():
+                    pending.append((_etree.SubElement(parent, key), child_value))
+            elif isinstance(value, list):
+                for item in value:
+                    pending.append((_etree.SubElement(parent, "item"), item))
             else:
-                parent.text = str(data)
-        
-        _dict_to_xml(root, data)
+                parent.text = str(value)
         
-        # pretty print XML
-        xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(xml_str)
+        _write_pretty_xml(filename, root)
         return True
     except Exception as e:
         print(f"error writing XML: {e}")
         return False
 
 def read_xml(filename: str) -> Optional[Dict[str, Any]]:
-    """read XML file into dictionary."""
+    """read XML file into dictionary.
+    
+    the file is parsed incrementally and each element is cleared once it
+    has been converted, so the full tree is never held next to the dict.
+    """
     try:
-        tree = ET.parse(filename)
-        root = tree.getroot()
-        
-        def _xml_to_dict(element: ET.Element) -> Any:
-            if len(element) == 0:
-                return element.text
+        # one (children dict, repeated tags) frame per open element
+        stack = []
+        for event, elem in ET.iterparse(filename, events=('start', 'end')):
+            if event == 'start':
+                stack.append(({}, set()))
+                continue
             
-            result = {}
-            list_tags = set()
-            
-            for child in element:
-                child_data = _xml_to_dict(child)
-                
-                if child.tag in result:
-                    if child.tag not in list_tags:
-                        result[child.tag] = [result[child.tag]]
-                        list_tags.add(child.tag)
-                    result[child.tag].append(child_data)
-                else:
-                    result[child.tag] = child_data
+            result, list_tags = stack.pop()
+            value = result if result else elem.text
+            elem.clear()
+            if not stack:
+                return {elem.tag: value}
             
-            return result
-        
-        return {root.tag: _xml_to_dict(root)}
+            parent, parent_lists = stack[-1]
+            if elem.tag in parent:
+                if elem.tag not in parent_lists:
+                    parent[elem.tag] = [parent[elem.tag]]
+                    parent_lists.add(elem.tag)
+                parent[elem.tag].append(value)
+            else:
+                parent[elem.tag] = value
+        return None
     except Exception as e:
         print(f"error reading XML: {e}")
         return None
@@ -80,9 +103,19 @@ def validate_xml_schema(xml_file: str, schema_file: str) -> bool:
 def search_xml(filename: str, tag: str) -> List[str]:
     """search for all elements with specific tag."""
     try:
-        tree = ET.parse(filename)
-        root = tree.getroot()
-        return [elem.text for elem in root.findall(f".//{tag}") if elem.text]
+        # stream the file instead of building the tree; the depth check
+        # skips the root, like findall(".//tag") does
+        results = []
+        depth = 0
+        for event, elem in ET.iterparse(filename, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth and elem.tag == tag and elem.text:
+                results.append(elem.text)
+            elem.clear()
+        return results
     except Exception as e:
         print(f"error searching XML: {e}")
         return []
@@ -90,10 +123,15 @@ def search_xml(filename: str, tag: str) -> List[str]:
 def modify_xml(filename: str, xpath: str, new_value: str) -> bool:
     """modify XML element using XPath."""
     try:
-        tree = ET.parse(filename)
-        root = tree.getroot()
+        if LE is not None:
+            # compiled, cached XPath evaluated in c
+            tree = LE.parse(filename)
+            elems = _xpath(xpath)(tree)
+        else:
+            tree = ET.parse(filename)
+            elems = tree.getroot().findall(xpath)
         
-        for elem in root.findall(xpath):
+        for elem in elems:
             elem.text = new_value
         
         tree.write(filename, encoding='utf-8', xml_declaration=True)
@@ -105,11 +143,11 @@ def modify_xml(filename: str, xpath: str, new_value: str) -> bool:
 def create_xml_with_attributes(filename: str, data: Dict[str, Any]) -> bool:
     """create XML with attributes and elements."""
     try:
-        root = ET.Element("root")
+        root = _etree.Element("root")
         
-        def _add_element(parent: ET.Element, key: str, value: Any):
+        def _add_element(parent: Any, key: str, value: Any):
             if isinstance(value, dict):
-                elem = ET.SubElement(parent, key)
+                elem = _etree.SubElement(parent, key)
                 attrs = value.get('_attributes', {})
                 for attr_key, attr_value in attrs.items():
                     elem.set(attr_key, str(attr_value))
@@ -121,16 +159,13 @@ def create_xml_with_attributes(filename: str, data: Dict[str, Any]) -> bool:
                 for item in value:
                     _add_element(parent, key, item)
             else:
-                elem = ET.SubElement(parent, key)
+                elem = _etree.SubElement(parent, key)
                 elem.text = str(value)
         
         for key, value in data.items():
             _add_element(root, key, value)
         
-        # pretty print XML
-        xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(xml_str)
+        _write_pretty_xml(filename, root)
         return True
     except Exception as e:
         print(f"error creating XML: {e}")
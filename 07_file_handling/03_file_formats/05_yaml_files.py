@@ -1,12 +1,43 @@
 # working with YAML files in python
+import copy
+import os
 import yaml
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 from datetime import datetime, date
 
-class CustomYAMLDumper(yaml.Dumper):
+# libyaml-backed loader/dumper when pyyaml was built with it; these parse
+# and emit in c rather than in the pure-python reference implementation
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# 128 KiB i/o buffer instead of the 8 KiB default, for fewer read/write calls
+IO_BUFSIZE = 128 * 1024
+
+# plain resolver used to look up the implicit tag of emitted scalars
+_RESOLVER = yaml.resolver.Resolver()
+
+@lru_cache(maxsize=4096)
+def _implicit_scalar_tag(value: str) -> str:
+    """return the tag a plain scalar would load as.
+    
+    the emitter asks this for every scalar to decide whether it needs
+    quoting, which means running the int/float/bool/... regexes on it;
+    keys and enum-like values repeat a lot, so each is matched only once.
+    """
+    return _RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+
+class CustomYAMLDumper(SafeDumper):
     """custom YAML dumper with additional type support."""
     
+    def resolve(self, kind, value, implicit):
+        if kind is yaml.ScalarNode and implicit[0]:
+            return _implicit_scalar_tag(value)
+        return super().resolve(kind, value, implicit)
+    
     def represent_datetime(self, data):
         return self.represent_scalar('tag:yaml.org,2002:timestamp', data.isoformat())
     
@@ -20,7 +51,7 @@ CustomYAMLDumper.add_representer(date, CustomYAMLDumper.represent_date)
 def write_yaml(filename: str, data: Any, flow_style: bool = False) -> bool:
     """write data to YAML file."""
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open(filename, 'w', encoding='utf-8', buffering=IO_BUFSIZE) as f:
             yaml.dump(data, f, Dumper=CustomYAMLDumper, 
                      default_flow_style=flow_style,
                      allow_unicode=True,
@@ -30,71 +61,138 @@ def write_yaml(filename: str, data: Any, flow_style: bool = False) -> bool:
         print(f"error writing YAML: {e}")
         return False
 
+def _parse_yaml(filename: str) -> Any:
+    """parse a YAML file, bypassing the cache."""
+    with open(filename, 'r', encoding='utf-8', buffering=IO_BUFSIZE) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int, inode: int) -> Any:
+    """parse a YAML file; the stat fields make a changed file a cache miss."""
+    return _parse_yaml(path)
+
+def _read_yaml_shared(filename: str) -> Any:
+    """return the cached parse of a YAML file; callers must not mutate it."""
+    st = os.stat(filename)
+    return _load_yaml_cached(os.path.abspath(filename), st.st_mtime_ns,
+                             st.st_size, st.st_ino)
+
 def read_yaml(filename: str) -> Optional[Any]:
-    """read data from YAML file."""
+    """read data from YAML file.
+    
+    parsed files are cached until they change on disk; callers get a deep
+    copy, so mutating the result never affects later reads.
+    """
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return copy.deepcopy(_read_yaml_shared(filename))
     except Exception as e:
         print(f"error reading YAML: {e}")
         return None
 
 def update_yaml(filename: str, updates: Dict[str, Any], create: bool = True) -> bool:
-    """update existing YAML file with new data."""
+    """update existing YAML file with new data.
+    
+    the file is only rewritten when the updates actually change something.
+    """
     try:
-        data = read_yaml(filename) if Path(filename).exists() else {}
+        exists = Path(filename).exists()
+        data = read_yaml(filename) if exists else {}
         if data is None and not create:
             return False
         
         data = data or {}
-        _deep_update(data, updates)
-        return write_yaml(filename, data)
+        if _deep_update(data, updates) or not exists:
+            return write_yaml(filename, data)
+        return True
     except Exception as e:
         print(f"error updating YAML: {e}")
         return False
 
-def _deep_update(target: Dict[str, Any], source: Dict[str, Any]):
-    """recursively update nested dictionary."""
-    for key, value in source.items():
-        if isinstance(value, dict) and key in target and isinstance(target[key], dict):
-            _deep_update(target[key], value)
-        else:
-            target[key] = value
+def _deep_update(target: Dict[str, Any], source: Dict[str, Any]) -> bool:
+    """update nested dictionary, merging dicts at every level.
+    
+    returns whether target was modified.
+    """
+    dirty = False
+    # explicit stack of (target, source) pairs instead of recursion
+    stack = [(target, source)]
+    while stack:
+        current, updates = stack.pop()
+        for key, value in updates.items():
+            existing = current.get(key)
+            if isinstance(value, dict) and isinstance(existing, dict):
+                stack.append((existing, value))
+            else:
+                # 1 == True and 1 == 1.0, but they dump differently
+                if (key not in current or existing != value
+                        or type(existing) is not type(value)):
+                    dirty = True
+                current[key] = value
+    return dirty
 
 def merge_yaml_files(files: List[str], output_file: str) -> bool:
     """merge multiple YAML files into one."""
     try:
         merged_data = {}
         for file in files:
-            data = read_yaml(file)
+            # parse each file fresh and fold it in before the next one, so
+            # only one parsed file is alive at a time; going through
+            # read_yaml would also keep every file in its cache and add a
+            # deep copy of each
+            try:
+                data = _parse_yaml(file)
+            except Exception as e:
+                print(f"error reading YAML: {e}")
+                continue
             if isinstance(data, dict):
                 _deep_update(merged_data, data)
             elif isinstance(data, list):
                 merged_data.setdefault('items', []).extend(data)
+            del data
         
         return write_yaml(output_file, merged_data)
     except Exception as e:
         print(f"error merging YAML files: {e}")
         return False
 
+@lru_cache(maxsize=32)
+def _schema_validator(schema_json: str) -> Any:
+    """check and compile a JSON schema once per distinct schema."""
+    import json
+    from jsonschema.validators import validator_for
+    schema = json.loads(schema_json)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
 def validate_yaml_schema(data: Any, schema: Dict[str, Any]) -> bool:
     """validate YAML data against schema."""
     try:
-        from jsonschema import validate
-        validate(instance=data, schema=schema)
+        import json
+        # keyed on the canonical JSON text rather than id(schema), so equal
+        # schemas share a validator and a recycled id can't return a stale one
+        validator = _schema_validator(json.dumps(schema, sort_keys=True))
+        validator.validate(data)
         return True
     except Exception as e:
         print(f"validation error: {e}")
         return False
 
-def yaml_to_json(yaml_file: str, json_file: str) -> bool:
-    """convert YAML file to JSON."""
+def yaml_to_json(yaml_file: str, json_file: str, compact: bool = False) -> bool:
+    """convert YAML file to JSON.
+    
+    compact drops indentation and separator spaces for a smaller file.
+    """
     try:
         import json
-        data = read_yaml(yaml_file)
+        # only read here, so the cached parse is used without a copy
+        data = _read_yaml_shared(yaml_file)
         if data is not None:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(json_file, 'w', encoding='utf-8', buffering=IO_BUFSIZE) as f:
+                if compact:
+                    json.dump(data, f, separators=(',', ':'), default=str)
+                else:
+                    json.dump(data, f, indent=2, default=str)
             return True
         return False
     except Exception as e:
@@ -105,7 +203,9 @@ def json_to_yaml(json_file: str, yaml_file: str) -> bool:
     """convert JSON file to YAML."""
     try:
         import json
-        with open(json_file, 'r', encoding='utf-8') as f:
+        # json parses straight from the binary handle with no decode pass,
+        # and write_yaml emits straight into its output handle
+        with open(json_file, 'rb', buffering=IO_BUFSIZE) as f:
             data = json.load(f)
         return write_yaml(yaml_file, data)
     except Exception as e:
@@ -0,0 +1,79 @@
+# tests for the CSV file helpers
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "03_file_formats" / "01_csv_files.py"
+
+RAGGED_CSV = "name,age,city\nAl,1,NY\nBo,2\nCy,,LA\n\nDi,3,LA\nEd\n"
+
+def load_module():
+    """load the module by path, since its file name isn't importable."""
+    spec = importlib.util.spec_from_file_location("csv_files", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(params=["polars", "stdlib"])
+def csv_files(request):
+    """the module with polars (when installed) and with the stdlib only."""
+    module = load_module()
+    if request.param == "polars":
+        if module.pl is None:
+            pytest.skip("polars is not installed")
+    else:
+        module.pl = None
+    return module
+
+@pytest.fixture
+def ragged_csv(tmp_path):
+    """a CSV file with short rows and a blank line."""
+    path = tmp_path / "ragged.csv"
+    path.write_text(RAGGED_CSV, encoding="utf-8")
+    return str(path)
+
+class TestFilterCsv:
+    """test cases for filter_csv."""
+    
+    def test_short_rows_are_padded(self, csv_files, ragged_csv):
+        """test fields missing from short rows come back as ''."""
+        assert csv_files.filter_csv(ragged_csv, "age", "2") == [
+            {"name": "Bo", "age": "2", "city": ""}
+        ]
+    
+    def test_match_on_missing_field(self, csv_files, ragged_csv):
+        """test a missing field matches '' but the blank line doesn't."""
+        rows = csv_files.filter_csv(ragged_csv, "city", "")
+        assert rows == [
+            {"name": "Bo", "age": "2", "city": ""},
+            {"name": "Ed", "age": "", "city": ""},
+        ]
+    
+    def test_columns_on_short_rows(self, csv_files, ragged_csv):
+        """test projecting a field a matching row lacks doesn't fail."""
+        assert csv_files.filter_csv(ragged_csv, "name", "Ed", columns=["name", "city"]) == [
+            {"name": "Ed", "city": ""}
+        ]
+
+class TestFilterCsvBackends:
+    """test the polars and stdlib backends of filter_csv agree."""
+    
+    @pytest.mark.parametrize("column, value, columns", [
+        ("city", "LA", None),
+        ("city", "", None),
+        ("age", "2", ["name", "city"]),
+        ("name", "Ed", ["city", "age"]),
+        ("city", "NY", ["name", "missing"]),
+    ])
+    def test_same_output(self, ragged_csv, column, value, columns):
+        """test both backends return identical rows for short-row input."""
+        fast = load_module()
+        if fast.pl is None:
+            pytest.skip("polars is not installed")
+        slow = load_module()
+        slow.pl = None
+        
+        expected = slow.filter_csv(ragged_csv, column, value, columns=columns)
+        assert expected
+        assert fast.filter_csv(ragged_csv, column, value, columns=columns) == expected
@@ -0,0 +1,60 @@
+# tests for the JSON file helpers
+import importlib.util
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "03_file_formats" / "02_json_files.py"
+
+def load_module():
+    """load the module by path, since its file name isn't importable."""
+    spec = importlib.util.spec_from_file_location("json_files", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_files(request):
+    """the module with orjson (when installed) and with the stdlib only."""
+    module = load_module()
+    if request.param == "orjson":
+        if module.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        module.orjson = None
+    return module
+
+class TestWriteJson:
+    """test cases for write_json."""
+    
+    def test_default_indent_matches_stdlib(self, json_files, tmp_path):
+        """test the default 4-space indent is honoured by every backend."""
+        data = {"name": "circle", "sizes": [1, 2, 3]}
+        path = tmp_path / "data.json"
+        assert json_files.write_json(str(path), data)
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=4)
+    
+    def test_large_int(self, json_files, tmp_path):
+        """test ints wider than 64 bits are written instead of failing."""
+        data = {"big": 2 ** 70}
+        path = tmp_path / "big.json"
+        assert json_files.write_json(str(path), data, indent=2)
+        assert json_files.read_json(str(path)) == data
+    
+    def test_nan_round_trip(self, json_files, tmp_path):
+        """test NaN and Infinity written by the stdlib can be read back."""
+        path = tmp_path / "nan.json"
+        path.write_text(json.dumps({"nan": float("nan"), "inf": float("inf")}))
+        data = json_files.read_json(str(path))
+        assert math.isnan(data["nan"])
+        assert data["inf"] == float("inf")
+
+class TestFormatJson:
+    """test cases for format_json."""
+    
+    def test_four_space_indent(self, json_files):
+        """test formatting is identical whichever backend is available."""
+        data = {"a": [1, {"b": None}]}
+        assert json_files.format_json(data) == json.dumps(data, indent=4)
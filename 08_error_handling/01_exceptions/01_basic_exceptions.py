@@ -2,7 +2,6 @@
 # this module covers the fundamentals of handling errors in python programs
 
 from typing import Any, Optional, Union, List
-import sys
 
 def divide_numbers(a: Union[int, float], b: Union[int, float]) -> Optional[float]:
     """performs division of two numbers with careful error handling
@@ -137,17 +136,26 @@ def demonstrate_else():
         print(f"you entered: {value}")
 
 def get_exception_info(code: str) -> dict:
-    """get detailed exception information."""
+    """get detailed exception information.
+    
+    the traceback location is the innermost frame, where the exception was
+    actually raised. exec is only here so any snippet can be tried; real
+    code should call the function it wants to inspect directly.
+    """
     try:
         exec(code)
     except Exception as e:
+        # the exception carries its own traceback, no need for sys.exc_info()
+        tb = e.__traceback__
+        while tb.tb_next:
+            tb = tb.tb_next
         return {
             'type': type(e).__name__,
             'message': str(e),
             'module': e.__class__.__module__,
             'traceback': {
-                'filename': sys.exc_info()[2].tb_frame.f_code.co_filename,
-                'line': sys.exc_info()[2].tb_lineno
+                'filename': tb.tb_frame.f_code.co_filename,
+                'line': tb.tb_lineno
             }
         }
     return {}
@@ -1,10 +1,36 @@
 # understanding python's exception hierarchy
 # this module explores how exceptions are organized in python's class hierarchy
 
-from typing import List, Dict, Any
+from typing import Any, Mapping, Tuple
+from functools import lru_cache
+from types import MappingProxyType
 import sys
 
-def explore_exception_hierarchy() -> Dict[str, List[str]]:
+# built-in exceptions are organized in a hierarchy; this is fixed data, so
+# it is built once as a read-only mapping of tuples and shared by all callers
+_EXCEPTION_CATEGORIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'arithmetic_errors': (
+        'ZeroDivisionError',   # when dividing by zero
+        'OverflowError',       # when a calculation is too large
+        'FloatingPointError'   # for floating-point calculation errors
+    ),
+    'lookup_errors': (
+        'KeyError',           # when a dictionary key isn't found
+        'IndexError',         # when a sequence index is out of range
+        'AttributeError'      # when an attribute/method doesn't exist
+    ),
+    'type_errors': (
+        'TypeError',          # when an operation has incompatible types
+        'ValueError'          # when an operation has invalid values
+    ),
+    'io_errors': (
+        'FileNotFoundError',  # when a file doesn't exist
+        'PermissionError',    # when we lack file access permissions
+        'IOError'            # base class for input/output errors
+    )
+})
+
+def explore_exception_hierarchy() -> Mapping[str, Tuple[str, ...]]:
     """explores and demonstrates python's built-in exception hierarchy
     
     why we need this:
@@ -14,31 +40,10 @@ def explore_exception_hierarchy() -> Dict[str, List[str]]:
     - create our own custom exceptions that fit into the hierarchy
     
     returns:
-        a dictionary mapping exception categories to their common examples
+        a read-only mapping of exception categories to their common
+        examples; copy it (e.g. with dict()) before modifying
     """
-    # built-in exceptions are organized in a hierarchy
-    exception_categories = {
-        'arithmetic_errors': [
-            'ZeroDivisionError',   # when dividing by zero
-            'OverflowError',       # when a calculation is too large
-            'FloatingPointError'   # for floating-point calculation errors
-        ],
-        'lookup_errors': [
-            'KeyError',           # when a dictionary key isn't found
-            'IndexError',         # when a sequence index is out of range
-            'AttributeError'      # when an attribute/method doesn't exist
-        ],
-        'type_errors': [
-            'TypeError',          # when an operation has incompatible types
-            'ValueError'          # when an operation has invalid values
-        ],
-        'io_errors': [
-            'FileNotFoundError',  # when a file doesn't exist
-            'PermissionError',    # when we lack file access permissions
-            'IOError'            # base class for input/output errors
-        ]
-    }
-    return exception_categories
+    return _EXCEPTION_CATEGORIES
 
 def demonstrate_exception_inheritance():
     """shows how exception inheritance works in practice
@@ -57,21 +62,25 @@ def demonstrate_exception_inheritance():
         print(f"caught a file system error: {e}")
         print(f"specific error type: {type(e).__name__}")
 
-def show_exception_details(exception_type: type) -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def show_exception_details(exception_type: type) -> Mapping[str, Any]:
     """explores the details of a specific exception type
     
     parameters:
         exception_type: the exception class to examine
     
     returns:
-        dictionary containing details about the exception
+        read-only mapping containing details about the exception
+    
+    the details of a class never change, so each class is only examined
+    once; the mapping is read-only because every caller shares it.
     """
-    return {
+    return MappingProxyType({
         'name': exception_type.__name__,
         'parent': exception_type.__base__.__name__,
         'module': exception_type.__module__,
         'doc': exception_type.__doc__
-    }
+    })
 
 def main():
     """demonstrates the exception hierarchy concepts"""
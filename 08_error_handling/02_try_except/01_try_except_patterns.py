@@ -1,11 +1,11 @@
 # try-except patterns and context managers in python
-from typing import Any, Optional, Generator, TextIO
+from typing import Any, Iterator, Mapping, Optional, Generator, TextIO, Tuple, Type
 from contextlib import contextmanager
 import time
 import logging
 from datetime import datetime
 import traceback
-import sys
+import re
 
 # configure logging
 logging.basicConfig(
@@ -13,6 +13,10 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# what int() accepts: optional whitespace and sign, digits with single
+# underscores between them; checked first so bad input never has to raise
+_INT_RE = re.compile(r'\s*[+-]?\d+(?:_\d+)*\s*')
+
 class RetryError(Exception):
     """custom error for retry failures."""
     pass
@@ -20,11 +24,12 @@ class RetryError(Exception):
 @contextmanager
 def timer():
     """context manager to measure execution time."""
-    start = time.time()
+    # monotonic clock, so wall-clock adjustments can't skew the result
+    start = time.monotonic()
     try:
         yield
     finally:
-        end = time.time()
+        end = time.monotonic()
         print(f"execution time: {end - start:.2f} seconds")
 
 @contextmanager
@@ -47,15 +52,21 @@ def file_handler(filename: str, mode: str = 'r') -> Generator[TextIO, None, None
         if file:
             file.close()
 
-def retry_operation(max_attempts: int = 3, delay: float = 1.0):
-    """decorator for retrying failed operations."""
+def retry_operation(max_attempts: int = 3, delay: float = 1.0,
+                    retry_on: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError)):
+    """decorator for retrying failed operations.
+    
+    only exceptions in retry_on are retried; anything else is a bug or a
+    permanent failure, so it propagates at once instead of being retried
+    and slept on.
+    """
     def decorator(func):
         def wrapper(*args, **kwargs):
             last_error = None
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except retry_on as e:
                     last_error = e
                     logging.warning(
                         f"attempt {attempt + 1}/{max_attempts} failed: {str(e)}"
@@ -71,6 +82,10 @@ def handle_multiple_exceptions(value: Any) -> Optional[str]:
     try:
         # attempt risky operations
         result = str(value).upper()
+        # pre-check instead of letting int() raise for the common bad case
+        if not _INT_RE.fullmatch(result):
+            logging.error(f"conversion error: invalid literal for int() with base 10: {result!r}")
+            return None
         int(result)  # try to convert to integer
         return result
     except (TypeError, ValueError) as e:
@@ -109,16 +124,44 @@ def exception_chaining():
     except RuntimeError as e:
         print(f"error chain: {e.__cause__}")
 
-def get_full_traceback():
-    """get formatted traceback information."""
+class TracebackInfo(Mapping):
+    """read-only traceback details that are only formatted when read.
+    
+    the exception is captured as a TracebackException, which keeps frame
+    summaries rather than live frames, so locals can be garbage collected
+    and no source lines are read until the traceback is formatted.
+    """
+    
+    def __init__(self, error: BaseException, stack: traceback.StackSummary):
+        self._error = traceback.TracebackException.from_exception(error, lookup_lines=False)
+        self._stack = stack
+        self._formatted: Optional[str] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'traceback':
+            if self._formatted is None:
+                self._formatted = ''.join(self._error.format())
+            return self._formatted
+        if key == 'stack':
+            return self._stack
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(('traceback', 'stack'))
+    
+    def __len__(self) -> int:
+        return 2
+
+def get_full_traceback() -> TracebackInfo:
+    """get formatted traceback information.
+    
+    the call stack is capped at the 20 innermost frames, and the
+    traceback text is only built if 'traceback' is read.
+    """
     try:
         raise ValueError("sample error")
-    except Exception:
-        return {
-            'traceback': traceback.format_exc(),
-            'stack': traceback.extract_stack(),
-            'frame': sys._getframe()
-        }
+    except Exception as e:
+        return TracebackInfo(e, traceback.extract_stack(limit=20))
 
 @retry_operation(max_attempts=3)
 def unstable_operation():
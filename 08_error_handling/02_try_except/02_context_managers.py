@@ -12,6 +12,10 @@ class DatabaseConnection:
     many resources (files, network connections, database connections) need proper cleanup
     context managers help us ensure resources are always properly released
     """
+    
+    # fixed attributes: no per-instance __dict__ for each connection
+    __slots__ = ('db_name', 'is_connected')
+    
     def __init__(self, db_name: str):
         self.db_name = db_name
         self.is_connected = False
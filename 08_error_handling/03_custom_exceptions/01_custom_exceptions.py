@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 import json
 import logging
+import time
 
 # configure logging
 logging.basicConfig(
@@ -10,6 +11,9 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# sentinel for fields that are absent, distinct from fields set to None
+_MISSING = object()
+
 class ValidationError(Exception):
     """base class for validation errors."""
     
@@ -24,9 +28,11 @@ class DataValidationError(ValidationError):
     def __init__(self, message: str, field: str, value: Any):
         super().__init__(message, field)
         self.value = value
+        # rendered once, since loggers may format the same error repeatedly
+        self._rendered = f"validation error in field '{field}': {message} (value: {value})"
     
     def __str__(self):
-        return f"validation error in field '{self.field}': {self.message} (value: {self.value})"
+        return self._rendered
 
 class DatabaseError(Exception):
     """base class for database errors."""
@@ -34,9 +40,17 @@ class DatabaseError(Exception):
     def __init__(self, message: str, query: Optional[str] = None):
         self.message = message
         self.query = query
-        self.timestamp = datetime.now()
+        # a plain integer is far cheaper to take than a datetime; the
+        # datetime is only built when timestamp is read
+        self.timestamp_ns = time.time_ns()
         super().__init__(self.message)
     
+    @property
+    def timestamp(self) -> datetime:
+        """when the error was created, as a local datetime."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+    
     def to_dict(self) -> Dict[str, Any]:
         """convert error to dictionary."""
         return {
@@ -53,9 +67,10 @@ class DatabaseConnectionError(DatabaseError):
         super().__init__(message)
         self.host = host
         self.port = port
+        self._rendered = f"failed to connect to database at {host}:{port} - {message}"
     
     def __str__(self):
-        return f"failed to connect to database at {self.host}:{self.port} - {self.message}"
+        return self._rendered
 
 class DatabaseQueryError(DatabaseError):
     """error for database query failures."""
@@ -63,9 +78,10 @@ class DatabaseQueryError(DatabaseError):
     def __init__(self, message: str, query: str, params: Optional[Dict[str, Any]] = None):
         super().__init__(message, query)
         self.params = params or {}
+        self._rendered = f"query failed: {message}\nQuery: {query}\nParams: {self.params}"
     
     def __str__(self):
-        return f"query failed: {self.message}\nQuery: {self.query}\nParams: {self.params}"
+        return self._rendered
 
 class ConfigurationError(Exception):
     """error for configuration issues."""
@@ -75,12 +91,14 @@ class ConfigurationError(Exception):
         self.config_file = config_file
         self.missing_keys = missing_keys or []
         super().__init__(self.message)
+        
+        rendered = f"configuration error in '{config_file}': {message}"
+        if self.missing_keys:
+            rendered += f"\nMissing keys: {', '.join(self.missing_keys)}"
+        self._rendered = rendered
     
     def __str__(self):
-        base_msg = f"configuration error in '{self.config_file}': {self.message}"
-        if self.missing_keys:
-            base_msg += f"\nMissing keys: {', '.join(self.missing_keys)}"
-        return base_msg
+        return self._rendered
 
 class APIError(Exception):
     """base class for API errors."""
@@ -89,9 +107,15 @@ class APIError(Exception):
         self.message = message
         self.status_code = status_code
         self.response = response
-        self.timestamp = datetime.now()
+        self.timestamp_ns = time.time_ns()
         super().__init__(self.message)
     
+    @property
+    def timestamp(self) -> datetime:
+        """when the error was created, as a local datetime."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+    
     def to_json(self) -> str:
         """convert error to JSON string."""
         return json.dumps({
@@ -107,9 +131,10 @@ class APIRequestError(APIError):
     def __init__(self, message: str, status_code: int, endpoint: str):
         super().__init__(message, status_code)
         self.endpoint = endpoint
+        self._rendered = f"API request failed: {message} (endpoint: {endpoint}, status: {status_code})"
     
     def __str__(self):
-        return f"API request failed: {self.message} (endpoint: {self.endpoint}, status: {self.status_code})"
+        return self._rendered
 
 class APIResponseError(APIError):
     """error for API response validation failures."""
@@ -117,38 +142,43 @@ class APIResponseError(APIError):
     def __init__(self, message: str, status_code: int, response: Dict[str, Any], expected_schema: Dict[str, Any]):
         super().__init__(message, status_code, response)
         self.expected_schema = expected_schema
+        self._rendered = f"API response validation failed: {message} (status: {status_code})"
     
     def __str__(self):
-        return f"API response validation failed: {self.message} (status: {self.status_code})"
+        return self._rendered
 
 def validate_user_data(data: Dict[str, Any]):
     """validate user data with custom exceptions."""
     required_fields = ['username', 'email', 'age']
     
-    # check required fields
+    # check required fields, fetching each value with a single lookup
+    values = []
     for field in required_fields:
-        if field not in data:
+        value = data.get(field, _MISSING)
+        if value is _MISSING:
             raise ValidationError(f"missing required field: {field}", field)
+        values.append(value)
+    username, email, age_value = values
     
     # validate username
-    if not isinstance(data['username'], str) or len(data['username']) < 3:
+    if not isinstance(username, str) or len(username) < 3:
         raise DataValidationError(
             "username must be a string with at least 3 characters",
             'username',
-            data['username']
+            username
         )
     
     # validate email
-    if '@' not in data.get('email', ''):
+    if '@' not in email:
         raise DataValidationError(
             "invalid email format",
             'email',
-            data['email']
+            email
         )
     
     # validate age
     try:
-        age = int(data['age'])
+        age = int(age_value)
         if age < 0 or age > 150:
             raise DataValidationError(
                 "age must be between 0 and 150",
@@ -159,7 +189,7 @@ def validate_user_data(data: Dict[str, Any]):
         raise DataValidationError(
             "age must be a valid number",
             'age',
-            data['age']
+            age_value
         )
 
 def simulate_database_operation(query: str, params: Dict[str, Any]):